@@ -5,22 +5,25 @@ Monitors a public GitHub repository and sends Discord messages when:
 - A new Issue is created
 
 No repository access required - uses GitHub's public API
+Notifications are posted through a Discord channel webhook, no bot login needed
 """
 
 import os
-import discord
-from discord.ext import commands, tasks
 from dotenv import load_dotenv
 import aiohttp
 import asyncio
+import ijson
+import orjson
+from aiolimiter import AsyncLimiter
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+from collections import OrderedDict
 from datetime import datetime, timezone
-import json
+import time
 
 load_dotenv()
 
 # Configuration
-DISCORD_BOT_TOKEN = os.getenv('DISCORD_BOT_TOKEN')
-DISCORD_CHANNEL_ID = int(os.getenv('DISCORD_CHANNEL_ID', '0'))
+DISCORD_WEBHOOK = os.getenv('DISCORD_WEBHOOK')  # Channel webhook URL
 GITHUB_REPO = os.getenv('GITHUB_REPO')  # Format: "owner/repo" e.g., "microsoft/vscode"
 GITHUB_TOKEN = os.getenv('GITHUB_TOKEN', '')  # Optional - increases rate limit
 CHECK_INTERVAL = int(os.getenv('CHECK_INTERVAL', '60'))  # Check every 60 seconds
@@ -28,46 +31,185 @@ CHECK_INTERVAL = int(os.getenv('CHECK_INTERVAL', '60'))  # Check every 60 second
 # Storage for tracking seen items
 SEEN_FILE = 'seen_items.json'
 
-# Initialize Discord bot
-intents = discord.Intents.default()
-intents.message_content = True
-bot = commands.Bot(command_prefix='!', intents=intents)
+# Embed descriptions are cut to this many characters
+DESCRIPTION_LIMIT = 500
 
-# Track what we've already seen
-seen_prs = set()
-seen_issues = set()
+# Discord embed colors
+PR_COLOR = 0x2ecc71  # green
+ISSUE_COLOR = 0xe74c3c  # red
+
+# Track what we've already seen (ordered oldest first, capped at MAX_SEEN_ITEMS)
+MAX_SEEN_ITEMS = 10000
+seen_prs = OrderedDict()
+seen_issues = OrderedDict()
+
+# Latest issue update time seen, used to only fetch issues changed since then
+last_poll_iso = None
+
+# `since` of the last issue check that returned a complete (not cut off) page,
+# only issues created at or after it are announced
+last_scan_iso = None
+
+# Issues requested per check
+ISSUE_PAGE_SIZE = 100
+
+# Creation time of the newest PR seen, only PRs created at or after it are announced
+last_pr_iso = None
+
+# Open PRs requested per page (the pulls endpoint has no `since` filter), more
+# pages are only fetched while a whole page is newer than last_pr_iso
+PR_PAGE_SIZE = 10
+MAX_PR_PAGES = 10
+
+# Set when seen items change and need to be written to disk
+_dirty = False
+
+# Shared HTTP session for GitHub and Discord requests (created in poll_forever)
+# Connections are kept alive between checks to skip the TCP/TLS handshake
+http_session = None
+HTTP_POOL_SIZE = 4
+HTTP_TIMEOUT = 10
+
+# Discord limits per webhook message: 10 embeds, 6000 characters across them
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+# Discord limits per embed
+MAX_EMBED_TITLE = 256
+MAX_EMBED_FIELD_VALUE = 1024
+
+# Conditional request cache: url -> (ETag, Last-Modified)
+# A 304 Not Modified response costs no rate limit and returns no body
+_etag_cache: dict[str, tuple[str, str]] = {}
+NOT_MODIFIED = object()
+
+# GitHub requests currently in flight: (url, keep) -> task fetching the result
+# Concurrent callers for the same url and filter share a single request
+_inflight: dict[tuple, asyncio.Task] = {}
+
+# Keep requests under GitHub's hourly quota (5000 with a token, 60 without)
+github_limiter = AsyncLimiter(max_rate=4500 if GITHUB_TOKEN else 55, time_period=3600)
+
+# Latest rate limit info reported by GitHub
+RATE_LIMIT_THRESHOLD = 100  # Slow down polling below this (or a fifth of a smaller quota)
+RATE_LIMIT_RESERVE = 50  # Wait for the reset below this (or a tenth of a smaller quota)
+RATE_LIMIT_RESET_MARGIN = 5  # Seconds to wait past the reset before polling again
+rate_limit_limit = None
+rate_limit_remaining = None
+rate_limit_reset = None
+
+# Current delay between checks, raised when close to the rate limit
+check_interval = CHECK_INTERVAL
 
 
 def load_seen_items():
     """Load previously seen items from file"""
-    global seen_prs, seen_issues
+    global seen_prs, seen_issues, last_poll_iso, last_scan_iso, last_pr_iso, _dirty
     try:
         if os.path.exists(SEEN_FILE):
-            with open(SEEN_FILE, 'r') as f:
-                data = json.load(f)
-                seen_prs = set(data.get('prs', []))
-                seen_issues = set(data.get('issues', []))
+            with open(SEEN_FILE, 'rb') as f:
+                data = orjson.loads(f.read())
+                seen_prs = OrderedDict.fromkeys(data.get('prs', [])[-MAX_SEEN_ITEMS:])
+                seen_issues = OrderedDict.fromkeys(data.get('issues', [])[-MAX_SEEN_ITEMS:])
+                last_poll_iso = data.get('last_poll')
+                last_scan_iso = data.get('last_scan', last_poll_iso)
+                last_pr_iso = data.get('last_pr')
                 print(f"Loaded {len(seen_prs)} seen PRs and {len(seen_issues)} seen issues")
     except Exception as e:
         print(f"Error loading seen items: {e}")
-        seen_prs = set()
-        seen_issues = set()
+        seen_prs = OrderedDict()
+        seen_issues = OrderedDict()
+    
+    # First run: only announce items created from now on
+    now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    if last_poll_iso is None:
+        last_poll_iso = now
+        _dirty = True
+    if last_scan_iso is None:
+        last_scan_iso = last_poll_iso
+        _dirty = True
+    if last_pr_iso is None:
+        last_pr_iso = now
+        _dirty = True
 
 
 def save_seen_items():
     """Save seen items to file"""
+    global _dirty
     try:
-        with open(SEEN_FILE, 'w') as f:
-            json.dump({
+        # Write to a temporary file first so a crash never leaves a truncated file
+        tmp_file = f"{SEEN_FILE}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps({
                 'prs': list(seen_prs),
-                'issues': list(seen_issues)
-            }, f)
+                'issues': list(seen_issues),
+                'last_poll': last_poll_iso,
+                'last_scan': last_scan_iso,
+                'last_pr': last_pr_iso
+            }))
+        os.replace(tmp_file, SEEN_FILE)
+        _dirty = False
     except Exception as e:
         print(f"Error saving seen items: {e}")
 
 
-async def fetch_github_data(session, url):
-    """Fetch data from GitHub API"""
+def mark_seen(seen, item_id):
+    """Record an item as seen, evicting the oldest entries past MAX_SEEN_ITEMS.
+    Returns True if the item had not been seen before."""
+    global _dirty
+    if item_id in seen:
+        seen.move_to_end(item_id)
+        return False
+    
+    seen[item_id] = None
+    while len(seen) > MAX_SEEN_ITEMS:
+        seen.popitem(last=False)
+    _dirty = True
+    return True
+
+
+class GitHubItems(list):
+    """Items kept from a GitHub API response.
+    `latest_updated` is the newest `updated_at` and `parsed_count` the number
+    of items across every parsed item, including the ones dropped by the
+    `keep` filter."""
+    latest_updated = None
+    parsed_count = 0
+
+
+class GitHubRetryableError(Exception):
+    """GitHub answered with a status worth retrying (rate limit 403/429 or 5xx)"""
+    
+    def __init__(self, status, retry_after=0):
+        super().__init__(f"GitHub API error: {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+def is_issue(item):
+    """Filter out pull requests (GitHub API returns PRs as issues too)"""
+    return 'pull_request' not in item
+
+
+async def fetch_github_data(session, url, keep=None):
+    """Fetch a list of items from GitHub API.
+    If the same url is already being fetched with the same `keep` filter, wait
+    for that request instead of sending another one."""
+    key = (url, keep)
+    task = _inflight.get(key)
+    if task is None:
+        # Run the request as its own task so cancelling one caller leaves the others waiting on it
+        task = asyncio.ensure_future(load_github_data(session, url, keep))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    
+    return await asyncio.shield(task)
+
+
+async def load_github_data(session, url, keep):
+    """Fetch a list of items from GitHub API.
+    The response is parsed one item at a time; items rejected by `keep` are
+    dropped straight away and bodies are trimmed to what the embed shows."""
     headers = {
         'Accept': 'application/vnd.github.v3+json',
     }
@@ -76,184 +218,395 @@ async def fetch_github_data(session, url):
     if GITHUB_TOKEN:
         headers['Authorization'] = f'token {GITHUB_TOKEN}'
     
+    # Only ask for the body if it changed since the last fetch
+    if url in _etag_cache:
+        etag, last_modified = _etag_cache[url]
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    
     try:
+        return await request_github_data(session, url, headers, keep)
+    except GitHubRetryableError as e:
+        if e.status in (403, 429):
+            print("Rate limit exceeded. Consider adding a GITHUB_TOKEN to increase limits.")
+        else:
+            print(f"GitHub API error: {e.status}")
+        return None
+    except Exception as e:
+        print(f"Error fetching GitHub data: {e}")
+        return None
+
+
+_github_backoff = wait_exponential(min=2, max=60)
+
+
+def github_retry_wait(retry_state):
+    """Back off exponentially, but never retry sooner than GitHub's Retry-After"""
+    error = retry_state.outcome.exception()
+    return max(_github_backoff(retry_state), getattr(error, 'retry_after', 0))
+
+
+@retry(
+    retry=retry_if_exception_type(GitHubRetryableError),
+    wait=github_retry_wait,
+    stop=stop_after_attempt(5),
+    reraise=True,
+)
+async def request_github_data(session, url, headers, keep):
+    """Send a single rate limited GitHub API request, retrying on rate limits and 5xx"""
+    await wait_for_rate_limit_reset()
+    
+    async with github_limiter:
         async with session.get(url, headers=headers) as response:
-            if response.status == 200:
-                return await response.json()
+            update_rate_limit(response.headers)
+            if response.status == 304:
+                return NOT_MODIFIED
+            elif response.status == 200:
+                items = GitHubItems()
+                async for item in ijson.items_async(response.content, 'item', use_float=True):
+                    items.parsed_count += 1
+                    updated_at = item.get('updated_at')
+                    if updated_at and (items.latest_updated is None or updated_at > items.latest_updated):
+                        items.latest_updated = updated_at
+                    if keep and not keep(item):
+                        continue
+                    # One extra character so format_description still knows to add "..."
+                    if item.get('body'):
+                        item['body'] = item['body'][:DESCRIPTION_LIMIT + 1]
+                    items.append(item)
+                
+                # Only cache the ETag once the whole body was read successfully
+                _etag_cache[url] = (response.headers.get('ETag', ''), response.headers.get('Last-Modified', ''))
+                return items
+            elif is_rate_limited(response) or response.status >= 500:
+                raise GitHubRetryableError(response.status, parse_retry_after(response.headers))
             elif response.status == 403:
-                print("Rate limit exceeded. Consider adding a GITHUB_TOKEN to increase limits.")
+                # Not a rate limit (private or blocked repository, bad token) - retrying cannot help
+                print("GitHub API error: 403 Forbidden. Check GITHUB_REPO and GITHUB_TOKEN.")
                 return None
             else:
                 print(f"GitHub API error: {response.status}")
                 return None
-    except Exception as e:
-        print(f"Error fetching GitHub data: {e}")
-        return None
 
 
-def create_pr_embed(pr):
-    """Create a Discord embed for pull request"""
-    embed = discord.Embed(
-        title=f"New Pull Request: {pr['title']} -  by {pr['user']['login']}",
-        url=pr['html_url'],
-        description=(pr['body'][:500] if pr.get('body') else "No description provided") + ("..." if pr.get('body') and len(pr['body']) > 500 else ""),
-        color=discord.Color.green(),
-        timestamp=datetime.fromisoformat(pr['created_at'].replace('Z', '+00:00'))
-    )
+def is_rate_limited(response):
+    """Whether a GitHub 403/429 is a rate limit rather than a permanent refusal"""
+    return response.status == 429 or (response.status == 403 and (
+        response.headers.get('X-RateLimit-Remaining') == '0' or 'Retry-After' in response.headers
+    ))
+
+
+def parse_retry_after(headers):
+    """Seconds GitHub asked us to wait before retrying (secondary rate limits)"""
+    try:
+        return float(headers.get('Retry-After', 0))
+    except ValueError:
+        return 0
+
+
+async def wait_for_rate_limit_reset():
+    """Sleep until the rate limit window resets when almost out of requests"""
+    if rate_limit_remaining is None or rate_limit_reset is None or rate_limit_remaining >= scaled_to_quota(RATE_LIMIT_RESERVE, 10):
+        return
     
-    embed.add_field(name="Repository", value=GITHUB_REPO, inline=True)
-    embed.add_field(name="Author", value=pr['user']['login'], inline=True)
-    embed.add_field(name="Branch", value=f"{pr['head']['ref']} → {pr['base']['ref']}", inline=False)
+    wait = rate_limit_reset - time.time()
+    if wait > 0:
+        print(f"Only {rate_limit_remaining} GitHub requests left, waiting {wait:.0f} seconds for the reset")
+        await asyncio.sleep(wait)
+
+
+def update_rate_limit(headers):
+    """Record the rate limit headers from a GitHub API response"""
+    global rate_limit_limit, rate_limit_remaining, rate_limit_reset
+    try:
+        if 'X-RateLimit-Limit' in headers:
+            rate_limit_limit = int(headers['X-RateLimit-Limit'])
+        if 'X-RateLimit-Remaining' in headers:
+            rate_limit_remaining = int(headers['X-RateLimit-Remaining'])
+        if 'X-RateLimit-Reset' in headers:
+            rate_limit_reset = int(headers['X-RateLimit-Reset'])
+    except ValueError:
+        pass
+
+
+def scaled_to_quota(count, divisor):
+    """Cap a request count at a share of the quota GitHub reports, so limits
+    meant for the 5000/h token quota still leave room in the 60/h one"""
+    if rate_limit_limit is None:
+        return count
+    return min(count, rate_limit_limit // divisor)
+
+
+def adjust_check_interval():
+    """Slow down polling when close to the rate limit, restore it otherwise"""
+    global check_interval
+    interval = CHECK_INTERVAL
+    if rate_limit_remaining is not None and rate_limit_reset is not None and rate_limit_remaining < scaled_to_quota(RATE_LIMIT_THRESHOLD, 5):
+        # Spread the remaining requests (two per check) until the window resets,
+        # but never wait past the reset when the full quota is back
+        seconds_to_reset = max(rate_limit_reset - time.time(), 0)
+        spread = seconds_to_reset * 2 / max(rate_limit_remaining, 1)
+        interval = max(CHECK_INTERVAL, min(spread, seconds_to_reset + RATE_LIMIT_RESET_MARGIN))
     
-    if pr.get('labels'):
-        labels = ', '.join([label['name'] for label in pr['labels']])
-        if labels:
-            embed.add_field(name="Labels", value=labels, inline=False)
+    if interval != check_interval:
+        print(f"Rate limit remaining: {rate_limit_remaining}. Check interval set to {interval:.0f} seconds")
+        check_interval = interval
+
+
+def truncate(text, limit):
+    """Cut text to at most `limit` characters so Discord does not reject the embed"""
+    if len(text) > limit:
+        return text[:limit - 3] + "..."
+    return text
+
+
+def format_description(body):
+    """Cut an item body down to an embed description"""
+    if not body:
+        return "No description provided"
+    if len(body) > DESCRIPTION_LIMIT:
+        return body[:DESCRIPTION_LIMIT] + "..."
+    return body
+
+
+def format_labels(labels):
+    """Join label names into a single comma separated string"""
+    return truncate(', '.join(label['name'] for label in labels or ()), MAX_EMBED_FIELD_VALUE)
+
+
+def create_pr_embed(pr):
+    """Create a Discord embed for pull request"""
+    embed = {
+        'title': truncate(f"New Pull Request: {pr['title']} -  by {pr['user']['login']}", MAX_EMBED_TITLE),
+        'url': pr['html_url'],
+        'description': format_description(pr.get('body')),
+        'color': PR_COLOR,
+        'timestamp': pr['created_at'],  # already ISO 8601, accepted by Discord as-is
+        'fields': [
+            {'name': "Repository", 'value': GITHUB_REPO, 'inline': True},
+            {'name': "Author", 'value': pr['user']['login'], 'inline': True},
+            {'name': "Branch", 'value': f"{pr['head']['ref']} → {pr['base']['ref']}", 'inline': False},
+        ],
+        'thumbnail': {'url': pr['user']['avatar_url']},
+        'footer': {'text': f"PR #{pr['number']}"},
+    }
     
-    embed.set_thumbnail(url=pr['user']['avatar_url'])
-    embed.set_footer(text=f"PR #{pr['number']}")
+    labels = format_labels(pr.get('labels'))
+    if labels:
+        embed['fields'].append({'name': "Labels", 'value': labels, 'inline': False})
     
     return embed
 
 
 def create_issue_embed(issue):
     """Create a Discord embed for issue"""
-    embed = discord.Embed(
-        title=f"New Issue: {issue['title']}",
-        url=issue['html_url'],
-        description=(issue['body'][:500] if issue.get('body') else "No description provided") + ("..." if issue.get('body') and len(issue['body']) > 500 else ""),
-        color=discord.Color.red(),
-        timestamp=datetime.fromisoformat(issue['created_at'].replace('Z', '+00:00'))
-    )
-    
-    embed.add_field(name="Repository", value=GITHUB_REPO, inline=True)
-    embed.add_field(name="Author", value=issue['user']['login'], inline=True)
-    
-    if issue.get('labels'):
-        labels = ', '.join([label['name'] for label in issue['labels']])
-        if labels:
-            embed.add_field(name="Labels", value=labels, inline=False)
+    embed = {
+        'title': truncate(f"New Issue: {issue['title']}", MAX_EMBED_TITLE),
+        'url': issue['html_url'],
+        'description': format_description(issue.get('body')),
+        'color': ISSUE_COLOR,
+        'timestamp': issue['created_at'],  # already ISO 8601, accepted by Discord as-is
+        'fields': [
+            {'name': "Repository", 'value': GITHUB_REPO, 'inline': True},
+            {'name': "Author", 'value': issue['user']['login'], 'inline': True},
+        ],
+        'thumbnail': {'url': issue['user']['avatar_url']},
+        'footer': {'text': f"Issue #{issue['number']}"},
+    }
     
-    embed.set_thumbnail(url=issue['user']['avatar_url'])
-    embed.set_footer(text=f"Issue #{issue['number']}")
+    labels = format_labels(issue.get('labels'))
+    if labels:
+        embed['fields'].append({'name': "Labels", 'value': labels, 'inline': False})
     
     return embed
 
 
-async def send_discord_message(embed):
-    """Send embed to Discord channel"""
+def embed_size(embed):
+    """Count the characters Discord includes in its per-message embed limit"""
+    return (
+        len(embed.get('title', ''))
+        + len(embed.get('description', ''))
+        + sum(len(field['name']) + len(field['value']) for field in embed.get('fields', ()))
+        + len(embed.get('footer', {}).get('text', ''))
+    )
+
+
+def batch_embeds(embeds):
+    """Group embeds into as few messages as Discord's limits allow, keeping order"""
+    batch = []
+    batch_size = 0
+    for embed in embeds:
+        size = embed_size(embed)
+        if batch and (len(batch) == MAX_EMBEDS_PER_MESSAGE or batch_size + size > MAX_EMBED_CHARS_PER_MESSAGE):
+            yield batch
+            batch = []
+            batch_size = 0
+        batch.append(embed)
+        batch_size += size
+    
+    if batch:
+        yield batch
+
+
+async def send_discord_message(embeds):
+    """Send a message with one or more embeds to Discord channel through the webhook"""
     try:
-        channel = bot.get_channel(DISCORD_CHANNEL_ID)
-        if channel:
-            await channel.send(embed=embed)
+        for _ in range(3):
+            async with http_session.post(DISCORD_WEBHOOK, json={'embeds': embeds}) as response:
+                status = response.status
+                if status == 429:
+                    # Rate limited - wait as long as Discord asks, then retry
+                    retry_after = float(response.headers.get('Retry-After', '1'))
+                    print(f"Discord rate limit hit, retrying in {retry_after} seconds")
+                    await asyncio.sleep(retry_after)
+                    continue
+            break
         else:
-            print(f"Channel {DISCORD_CHANNEL_ID} not found")
+            print(f"Discord rate limit still hit after 3 attempts, dropping {len(embeds)} notification(s)")
+            return
+        
+        if status == 400 and len(embeds) > 1:
+            # One invalid embed rejects the whole message - send them one by one so the rest still arrive
+            print(f"Discord rejected a batch of {len(embeds)} embeds, sending them separately")
+            for embed in embeds:
+                await asyncio.sleep(0.25)
+                await send_discord_message([embed])
+        elif status >= 400:
+            print(f"Discord webhook error: {status}")
     except Exception as e:
         print(f"Error sending Discord message: {e}")
 
 
-@tasks.loop(seconds=CHECK_INTERVAL)
+def build_pr_url(page=1):
+    """Build the pull request list URL for one page of the newest PRs"""
+    return f"https://api.github.com/repos/{GITHUB_REPO}/pulls?state=open&sort=created&direction=desc&per_page={PR_PAGE_SIZE}&page={page}"
+
+
+async def fetch_new_prs():
+    """Fetch the newest open PRs, following further pages only while every PR
+    on the current page was created after last_pr_iso (a burst of new PRs)"""
+    prs = []
+    for page in range(1, MAX_PR_PAGES + 1):
+        items = await fetch_github_data(http_session, build_pr_url(page))
+        if page == 1 and (items is None or items is NOT_MODIFIED):
+            return items
+        if items is None:
+            # Forget the first page so the whole burst is fetched again next check
+            _etag_cache.pop(build_pr_url(1), None)
+            return None
+        if items is NOT_MODIFIED:
+            # Unchanged since it was last fetched and handled
+            break
+        
+        prs.extend(items)
+        if len(items) < PR_PAGE_SIZE or any(pr['created_at'] < last_pr_iso for pr in items):
+            break
+    
+    return prs
+
+
+def build_issue_url():
+    """Build the issue list URL, only fetching issues updated since the last check"""
+    return f"https://api.github.com/repos/{GITHUB_REPO}/issues?state=open&since={last_poll_iso}&sort=updated&direction=asc&per_page={ISSUE_PAGE_SIZE}"
+
+
 async def check_repository():
     """Periodically check repository for new PRs and issues"""
+    global last_poll_iso, last_scan_iso, last_pr_iso, _dirty
     print(f"Checking repository: {GITHUB_REPO}")
     
-    async with aiohttp.ClientSession() as session:
-        # Check for new Pull Requests
-        pr_url = f"https://api.github.com/repos/{GITHUB_REPO}/pulls?state=open&sort=created&direction=desc&per_page=10"
-        prs = await fetch_github_data(session, pr_url)
+    # Fetch Pull Requests and Issues concurrently
+    issue_since = last_poll_iso
+    issue_url = build_issue_url()
+    prs, issues = await asyncio.gather(
+        fetch_new_prs(),
+        fetch_github_data(http_session, issue_url, keep=is_issue),
+    )
+    
+    embeds = []
+    
+    # Check for new Pull Requests
+    if prs and prs is not NOT_MODIFIED:
+        # Older PRs were open before the last check (or before the first run)
+        new_prs = [pr for pr in prs if pr['created_at'] >= last_pr_iso and mark_seen(seen_prs, pr['id'])]
+        
+        # Queue notifications for new PRs (oldest first)
+        for pr in sorted(new_prs, key=lambda pr: pr['created_at']):
+            embeds.append(create_pr_embed(pr))
+            print(f"New PR detected: #{pr['number']} - {pr['title']}")
         
-        if prs:
-            new_prs = []
-            for pr in prs:
-                pr_id = pr['id']
-                if pr_id not in seen_prs:
-                    new_prs.append(pr)
-                    seen_prs.add(pr_id)
-            
-            # Send notifications for new PRs (in reverse order, oldest first)
-            for pr in reversed(new_prs):
-                embed = create_pr_embed(pr)
-                await send_discord_message(embed)
-                print(f"New PR detected: #{pr['number']} - {pr['title']}")
-                await asyncio.sleep(1)  # Small delay between messages
+        latest = max(pr['created_at'] for pr in prs)
+        if latest > last_pr_iso:
+            last_pr_iso = latest
+            _dirty = True
+    
+    # Check for new Issues
+    if issues is not None and issues is not NOT_MODIFIED:
+        # `since` also returns old issues that were just commented on or relabeled.
+        # Compare against the last complete scan, not the cursor: when a page is
+        # cut off, a new issue bumped past it comes back on a later page.
+        new_issues = [issue for issue in issues if issue['created_at'] >= last_scan_iso and mark_seen(seen_issues, issue['id'])]
         
-        # Check for new Issues
-        issue_url = f"https://api.github.com/repos/{GITHUB_REPO}/issues?state=open&sort=created&direction=desc&per_page=10"
-        issues_data = await fetch_github_data(session, issue_url)
+        # Queue notifications for new issues (oldest first)
+        for issue in sorted(new_issues, key=lambda issue: issue['created_at']):
+            embeds.append(create_issue_embed(issue))
+            print(f"New issue detected: #{issue['number']} - {issue['title']}")
         
-        if issues_data:
-            # Filter out pull requests (GitHub API returns PRs as issues too)
-            issues = [issue for issue in issues_data if 'pull_request' not in issue]
-            
-            new_issues = []
-            for issue in issues:
-                issue_id = issue['id']
-                if issue_id not in seen_issues:
-                    new_issues.append(issue)
-                    seen_issues.add(issue_id)
-            
-            # Send notifications for new issues (in reverse order, oldest first)
-            for issue in reversed(new_issues):
-                embed = create_issue_embed(issue)
-                await send_discord_message(embed)
-                print(f"New issue detected: #{issue['number']} - {issue['title']}")
-                await asyncio.sleep(1)  # Small delay between messages
+        # Only ask for issues updated after this batch next time (PRs included,
+        # otherwise a page of only updated PRs would stop the cursor)
+        latest = issues.latest_updated
+        if latest and latest > last_poll_iso:
+            last_poll_iso = latest
+            _etag_cache.pop(issue_url, None)
+            _dirty = True
         
-        # Save seen items
+        # A page that was not cut off returned every issue updated since `issue_since`
+        if issues.parsed_count < ISSUE_PAGE_SIZE and issue_since != last_scan_iso:
+            last_scan_iso = issue_since
+            _dirty = True
+    
+    # Send notifications, batching several embeds into each message
+    for i, batch in enumerate(batch_embeds(embeds)):
+        if i:
+            await asyncio.sleep(0.25)  # Small delay between messages
+        await send_discord_message(batch)
+    
+    # Save seen items only when something new was found
+    if _dirty:
         save_seen_items()
+    
+    adjust_check_interval()
 
 
-@check_repository.before_loop
-async def before_check_repository():
-    """Wait for bot to be ready before starting the loop"""
-    await bot.wait_until_ready()
-    print("Bot is ready, starting repository monitoring...")
-
-
-@bot.event
-async def on_ready():
-    """Bot ready event"""
-    print(f'Discord bot logged in as {bot.user.name} (ID: {bot.user.id})')
+async def poll_forever():
+    """Check the repository every check_interval seconds"""
+    global http_session
     print(f'Monitoring repository: {GITHUB_REPO}')
-    print(f'Notification channel ID: {DISCORD_CHANNEL_ID}')
     print(f'Check interval: {CHECK_INTERVAL} seconds')
     print('------')
     
     # Load previously seen items
     load_seen_items()
     
-    # Start the monitoring task
-    if not check_repository.is_running():
-        check_repository.start()
-
-
-@bot.command(name='status')
-async def status(ctx):
-    """Check bot status"""
-    if ctx.channel.id == DISCORD_CHANNEL_ID:
-        await ctx.send(f"✅ Monitoring **{GITHUB_REPO}**\n"
-                      f"📊 Tracking {len(seen_prs)} PRs and {len(seen_issues)} issues\n"
-                      f"⏱️ Checking every {CHECK_INTERVAL} seconds")
-
-
-@bot.command(name='reset')
-@commands.has_permissions(administrator=True)
-async def reset(ctx):
-    """Reset tracking (admin only)"""
-    if ctx.channel.id == DISCORD_CHANNEL_ID:
-        global seen_prs, seen_issues
-        seen_prs.clear()
-        seen_issues.clear()
-        save_seen_items()
-        await ctx.send("🔄 Tracking reset! Will notify about all current open PRs and issues on next check.")
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=HTTP_POOL_SIZE, keepalive_timeout=CHECK_INTERVAL + 30),
+        timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT),
+        json_serialize=lambda obj: orjson.dumps(obj).decode(),
+    ) as http_session:
+        while True:
+            try:
+                await check_repository()
+            except Exception as e:
+                print(f"Error checking repository: {e}")
+            await asyncio.sleep(check_interval)
 
 
 if __name__ == '__main__':
     # Validate environment variables
-    if not DISCORD_BOT_TOKEN:
-        raise ValueError("DISCORD_BOT_TOKEN environment variable is required")
-    if not DISCORD_CHANNEL_ID:
-        raise ValueError("DISCORD_CHANNEL_ID environment variable is required")
+    if not DISCORD_WEBHOOK:
+        raise ValueError("DISCORD_WEBHOOK environment variable is required")
     if not GITHUB_REPO:
         raise ValueError("GITHUB_REPO environment variable is required (format: owner/repo)")
     
@@ -261,5 +614,5 @@ if __name__ == '__main__':
     print(f"Will monitor: {GITHUB_REPO}")
     print(f"Check interval: {CHECK_INTERVAL} seconds")
     
-    # Run bot
-    bot.run(DISCORD_BOT_TOKEN)
+    # Run the polling loop
+    asyncio.run(poll_forever())